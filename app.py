@@ -1,467 +1,1100 @@
-#!/usr/bin/env python3
-"""
-PropPulse+ v2025.6 — Professional NBA Prop Analyzer
-Combined: Analysis Tools + Live Sheets Viewer
-Mobile-Optimized UI | Blue–Red Theme | Projection Snapshot Visual
-"""
-
-import os
-import io
-import base64
-import re
-from datetime import datetime, timedelta, timezone
-from contextlib import redirect_stdout
-
-import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.graph_objects as go
-
-# ===============================
-# 🔗 Google Sheets config (Live EV Board)
-# ===============================
-SHEET_ID = "1SHuoEg331k_dcrgBoc7y8gWbgw1QTKHFJRzzNRqiOnE"
-SHEET_GID = "1954146299"
-SHEET_CSV_URL = (
-    f"https://docs.google.com/spreadsheets/d/{SHEET_ID}/export"
-    f"?format=csv&gid={SHEET_GID}"
-)
-
-# ===============================
-# 🔧 Import Model
-# ===============================
-try:
-    import prop_ev as pe
-except ImportError as e:
-    st.error(f"❌ Failed to import prop_ev.py: {e}")
-    st.stop()
-
-# ===============================
-# ⚙️ PAGE CONFIG
-# ===============================
-st.set_page_config(
-    page_title="PropPulse+ | NBA Props",
-    page_icon="🏀",
-    layout="wide",
-    initial_sidebar_state="expanded",
-)
-
-# ===============================
-# 🎨 BRANDING — COLORS + CSS
-# ===============================
-st.markdown("""
-<style>
-:root {
-    --pp-blue: #007bff;
-    --pp-red:  #ff2d55;
-    --pp-dark: #0c0c0f;
-    --pp-card: #16171a;
-    --pp-border: #2a2b2f;
-    --pp-text: #e6e6e6;
-}
-
-html, body, [class*="css"]  {
-    color: var(--pp-text) !important;
-    background-color: var(--pp-dark) !important;
-}
-
-/* Cards */
-.pp-card {
-    background-color: var(--pp-card);
-    padding: 18px;
-    border-radius: 14px;
-    border: 1px solid var(--pp-border);
-}
-
-/* Buttons */
-.stButton button {
-    background: linear-gradient(90deg, var(--pp-blue), var(--pp-red)) !important;
-    border: 0px;
-    color: white !important;
-    padding: 0.7rem 1.2rem;
-    border-radius: 10px;
-    font-weight: 600;
-}
-
-/* Inputs */
-.stTextInput input,
-.stNumberInput input,
-.stSelectbox select {
-    background: var(--pp-card);
-    border: 2px solid var(--pp-border);
-    border-radius: 10px;
-    color: var(--pp-text);
-}
-
-/* Footer */
-#footer-note {
-    text-align: center;
-    font-size: 14px;
-    margin-top: 40px;
-    padding: 12px 0px;
-    color: #888;
-}
-</style>
-""", unsafe_allow_html=True)
-
-# ===============================
-# 🏀 LOGO (if present)
-# ===============================
-def get_logo_base64():
-    logo_path = "proppulse_logo.png"
-    if os.path.exists(logo_path):
-        with open(logo_path, "rb") as f:
-            return base64.b64encode(f.read()).decode()
-    return None
-
-logo_b64 = get_logo_base64()
-if logo_b64:
-    st.markdown(
-        f'<img src="data:image/png;base64,{logo_b64}" width="140">',
-        unsafe_allow_html=True
-    )
-
-st.markdown("## **PropPulse+ NBA Prop Analyzer**")
-# ===============================
-# 📌 SIDEBAR — User Controls
-# ===============================
-with st.sidebar:
-    st.markdown("### ⚙️ PropPulse+ Controls")
-    st.markdown("---")
-
-    mode = st.radio(
-        "Select Mode",
-        ["Single Prop Analyzer", "Batch Analyzer", "Live EV Sheet Viewer"],
-        index=0
-    )
-
-    st.markdown("---")
-    st.markdown("📅 **Date:** Today’s slate auto-detected")
-    st.markdown("---")
-
-    st.markdown("""
-    <div style='text-align:center;color:#888;font-size:13px;margin-top:40px;'>
-        PropPulse+ v2025.6<br>
-        Blue-Red Theme · Mobile Optimized
-    </div>
-    """, unsafe_allow_html=True)
-
-# ===============================
-# 🧩 MAIN LAYOUT
-# ===============================
-st.markdown("")
-
-# Helper: Clean line formatting
-def clean_float(value):
-    try:
-        return float(value)
-    except:
-        return None
-
-# ===============================
-# 🎯 PROJECTION SNAPSHOT — UI Block
-# ===============================
-def render_projection_snapshot(result):
-    """Pretty, mobile-friendly projection visual"""
-    if result is None:
-        return
-
-    proj = result.get("projection")
-    line = result.get("line")
-    ev  = result.get("EV¢")
-    conf = result.get("confidence")
-    opp = result.get("opponent")
-    dvp = result.get("dvp_mult")
-
-    st.markdown("### 📈 Model Snapshot")
-    container = st.container()
-    with container:
-        c1, c2, c3 = st.columns(3)
-
-        c1.metric("Projection", f"{proj:.2f}" if proj is not None else "—")
-        c2.metric("Line", line)
-        c3.metric("EV (¢)", ev)
-
-        st.markdown("")
-
-        st.markdown(
-            f"""
-            <div class="pp-card">
-                <b>Opponent:</b> {opp or "—"}<br>
-                <b>DvP Multiplier:</b> {dvp or "—"}<br>
-                <b>Confidence Score:</b> {conf or "—"}
-            </div>
-            """,
-            unsafe_allow_html=True
-        )
-# ==========================================================
-# 🔍 SINGLE PROP ANALYZER
-# ==========================================================
-if mode == "Single Prop Analyzer":
-    st.markdown("## 🔍 Single Prop Analyzer")
-
-    # Input form layout
-    with st.form("single_form"):
-        col1, col2, col3, col4 = st.columns(4)
-
-        player_name = col1.text_input("Player Name")
-        stat = col2.selectbox(
-            "Stat",
-            ["PTS", "REB", "AST", "PRA", "REB+AST", "PTS+REB", "PTS+AST", "FG3M"]
-        )
-        line = col3.text_input("Line (e.g., 7.5)")
-        odds = col4.text_input("Odds (e.g., -110)", "-110")
-
-        debug = st.checkbox("Enable Debug Mode", value=False)
-
-        submitted = st.form_submit_button("🚀 RUN ANALYSIS")
-
-    if submitted:
-        if not player_name or not line:
-            st.error("⚠️ Please provide both a player name and a line.")
-            st.stop()
-
-        settings = pe.load_settings()
-        line_val = clean_float(line)
-
-        with st.spinner("🧠 Running full PropPulse+ model…"):
-            try:
-                result = pe.analyze_single_prop(
-                    player=player_name,
-                    stat=stat,
-                    line=line_val,
-                    odds=odds,
-                    settings=settings,
-                    debug_mode=debug,
-                )
-            except Exception as e:
-                st.error(f"❌ Error while analyzing: {e}")
-                st.stop()
-
-        if result:
-            render_projection_snapshot(result)
-            st.markdown("### 📤 Full Output")
-            st.json(result)
-        else:
-            st.warning("⚠️ No data returned for this player.")
-# ==========================================================
-# 📦 BATCH ANALYZER
-# ==========================================================
-if mode == "Batch Analyzer":
-    st.markdown("## 📦 Batch Analyzer")
-
-    st.info("Enter multiple props and analyze them all at once.")
-
-    manual_entries = []
-
-    with st.form("batch_form"):
-        st.markdown("### ✏️ Enter Props")
-
-        num_rows = st.number_input(
-            "Number of props to enter",
-            min_value=1, max_value=150, value=5, step=1
-        )
-
-        for i in range(num_rows):
-            c1, c2, c3, c4 = st.columns(4)
-            p = c1.text_input(f"Player {i+1}")
-            s = c2.selectbox(
-                f"Stat {i+1}",
-                ["PTS", "REB", "AST", "PRA", "REB+AST", "PTS+REB", "PTS+AST", "FG3M"],
-                key=f"stat_{i}"
-            )
-            l = c3.text_input(f"Line {i+1}")
-            o = c4.text_input(f"Odds {i+1}", "-110")
-
-            if p and l:
-                manual_entries.append({
-                    "Player": p,
-                    "Stat": s,
-                    "Line": l,
-                    "Odds": o
-                })
-
-        submitted = st.form_submit_button("🚀 ANALYZE BATCH")
-
-    if manual_entries:
-        df_preview = pd.DataFrame(manual_entries)
-        st.subheader("📋 Preview")
-        st.dataframe(df_preview, use_container_width=True)
-
-        if submitted:
-            st.markdown("### 📊 Batch Results")
-            settings = pe.load_settings()
-            results = []
-
-            with st.spinner("🧠 Running batch analysis…"):
-                for entry in manual_entries:
-                    try:
-                        res = pe.analyze_single_prop(
-                            player=entry["Player"],
-                            stat=entry["Stat"],
-                            line=clean_float(entry["Line"]),
-                            odds=entry["Odds"],
-                            settings=settings,
-                            debug_mode=False,
-                        )
-                        if res:
-                            results.append(res)
-                    except Exception as e:
-                        st.error(f"Error analyzing {entry['Player']}: {e}")
-
-            if results:
-                df_results = pd.DataFrame(results)
-                st.dataframe(df_results, use_container_width=True)
-            else:
-                st.warning("⚠️ No results produced.")
-    else:
-        st.info("✏️ Add props above, then click ANALYZE BATCH.")
-# ==========================================================
-# 📡 LIVE EV SHEET VIEWER
-# ==========================================================
-if mode == "Live EV Sheet Viewer":
-    st.markdown("## 📡 Live EV Sheet Viewer")
-
-    st.info("This pulls directly from your Google Sheets EV board.")
-
-    @st.cache_data(ttl=300)
-    def load_live_sheet():
-        try:
-            df = pd.read_csv(SHEET_CSV_URL)
-            return df
-        except Exception as e:
-            st.error(f"❌ Error loading Google Sheet: {e}")
-            return None
-
-    with st.spinner("🔄 Loading live EV board…"):
-        df_sheet = load_live_sheet()
-
-    if df_sheet is not None:
-        st.success("✅ Live sheet loaded")
-        st.dataframe(df_sheet, use_container_width=True)
-
-        # Optional: simple filters for mobile usability
-        st.markdown("### 🔍 Quick Filter")
-        cols = df_sheet.columns.tolist()
-        col_to_filter = st.selectbox("Column", cols)
-        filter_val = st.text_input("Search")
-
-        if filter_val:
-            df_filtered = df_sheet[df_sheet[col_to_filter].astype(str).str.contains(filter_val, case=False)]
-            st.dataframe(df_filtered, use_container_width=True)
-# ==========================================================
-# 🛠️ UTILITY FUNCTIONS
-# ==========================================================
-
-def convert_df_to_csv(df: pd.DataFrame):
-    """Convert a dataframe to CSV bytes for download"""
-    return df.to_csv(index=False).encode("utf-8")
-
-
-def render_download_button(df, label="📥 Download CSV", file_name="proppulse_export.csv"):
-    """Generic CSV download button"""
-    if df is None or df.empty:
-        return
-
-    csv_bytes = convert_df_to_csv(df)
-
-    st.download_button(
-        label=label,
-        data=csv_bytes,
-        file_name=file_name,
-        mime="text/csv",
-        use_container_width=True
-    )
-
-
-# ==========================================================
-# 📉 CUSTOM PROJECTION VISUAL — GAIN/LOSS BAR
-# ==========================================================
-
-def render_projection_bar(projection, line):
-    """Draws a simple horizontal line showing projection vs line"""
-
-    if projection is None or line is None:
-        st.info("No projection available.")
-        return
-
-    diff = projection - line
-
-    color = "#007bff" if diff >= 0 else "#ff2d55"
-    label = "Projected ↑" if diff >= 0 else "Projected ↓"
-
-    fig = go.Figure()
-
-    fig.add_trace(
-        go.Indicator(
-            mode="number+delta",
-            value=projection,
-            delta={"reference": line, "relative": False},
-            number={"font": {"size": 38}},
-            title={"text": f"<b>{label}</b><br><span style='font-size:16px'>Line = {line}</span>"}
-        )
-    )
-
-    fig.update_layout(
-        height=200,
-        margin=dict(l=0, r=0, t=20, b=0),
-        template="plotly_dark"
-    )
-
-    st.plotly_chart(fig, use_container_width=True)
-# ==========================================================
-# 📱 MOBILE OPTIMIZATION — FIXES FOR SMALL SCREENS
-# ==========================================================
-
-st.markdown("""
-<style>
-/* Make inputs full width on mobile */
-@media (max-width: 768px) {
-    .stTextInput, .stNumberInput, .stSelectbox, .stButton {
-        width: 100% !important;
-    }
-
-    .block-container {
-        padding-left: 1rem !important;
-        padding-right: 1rem !important;
-    }
-
-    /* Force columns to stack vertically */
-    [data-testid="column"] {
-        display: block !important;
-        width: 100% !important;
-    }
-
-    /* Fix dropdown cutoff issue */
-    .stSelectbox > div {
-        overflow: visible !important;
-    }
-}
-</style>
-""", unsafe_allow_html=True)
-
-
-# ==========================================================
-# 🧾 FOOTER — PROPULSE BRANDING
-# ==========================================================
-
-st.markdown("""
-<div id="footer-note">
-    Built with ❤️ by <b>QacePicks</b><br>
-    Powered by PropPulse+ · Data-Driven NBA Betting Tools
-</div>
-""", unsafe_allow_html=True)
-# ==========================================================
-# 🧩 END OF MAIN APP LOGIC
-# ==========================================================
-
-def safe_run():
-    """Wrapper to prevent Streamlit from crashing silently."""
-    try:
-        pass  # All logic is executed above directly in the layout
-    except Exception as e:
-        st.error(f"Unexpected error in app: {e}")
-
-
-if __name__ == "__main__":
-    safe_run()
+#!/usr/bin/env python3
+"""
+PropPulse+ v2025.6 — Professional NBA Prop Analyzer
+Combined: Analysis Tools + Live Sheets Viewer
+Mobile-Optimized UI | Blue–Red Theme | Projection Snapshot Visual
+"""
+
+import os
+import io
+import time
+
+# pybase64 is a drop-in SIMD base64 codec — nice to have for encoding
+# assets, but the stdlib is fine when it isn't installed.
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+import re
+import functools
+from datetime import datetime
+from contextlib import redirect_stdout
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+import streamlit as st
+import pandas as pd
+import numpy as np
+
+# plotly.graph_objects is imported lazily inside render_projection_bar —
+# it is a heavy import and only chart renders need it.
+
+# ===============================
+# 🔗 Google Sheets config (Live EV Board)
+# ===============================
+SHEET_ID = "1SHuoEg331k_dcrgBoc7y8gWbgw1QTKHFJRzzNRqiOnE"
+SHEET_GID = "1954146299"
+
+
+@functools.lru_cache(maxsize=32)
+def to_csv_url(sheet_id: str, gid: str) -> str:
+    """Build (and memoize) the CSV export URL for a Google Sheet tab."""
+    return (
+        f"https://docs.google.com/spreadsheets/d/{sheet_id}/export"
+        f"?format=csv&gid={gid}"
+    )
+
+
+SHEET_CSV_URL = to_csv_url(SHEET_ID, SHEET_GID)
+
+# Compiled once — used to normalize sheet column headers on load
+_WS_RE = re.compile(r"\s+")
+
+# Shared session: keep-alive avoids a fresh TCP/TLS handshake on every
+# sheet refetch after the cache TTL expires.
+_HTTP = requests.Session()
+
+# Stamped once per script run — every analysis in a rerun shares the
+# same slate-day string, keeping _analyze_cached keys stable.
+_TODAY_STR = datetime.now().strftime("%Y-%m-%d")
+
+# Stat options shared by the single-prop selectbox and the batch editor
+_STAT_OPTIONS = ("PTS", "REB", "AST", "PRA", "REB+AST", "PTS+REB", "PTS+AST", "FG3M")
+
+# ===============================
+# 🔧 Import Model
+# ===============================
+@st.cache_resource(show_spinner=False)
+def get_pe():
+    """Import the model module on first use and share it across sessions.
+
+    prop_ev drags in scipy, nba_api and the fetcher stack at import time;
+    the Live EV Sheet Viewer never calls it, so deferring the import
+    keeps that mode's cold start paying only for pandas and streamlit.
+    """
+    try:
+        import prop_ev
+    except ImportError as e:
+        st.error(f"❌ Failed to import prop_ev.py: {e}")
+        st.stop()
+    return prop_ev
+
+
+@st.cache_resource(show_spinner=False)
+def get_settings():
+    """settings.json is static per process — load and parse it once."""
+    return get_pe().load_settings()
+
+
+@st.cache_data(ttl=900, show_spinner=False)
+def _analyze_cached(player, stat, line, odds, date_str):
+    """Memoized analyze_single_prop keyed on its scalar inputs.
+
+    Users re-submit the same (player, stat, line, odds) constantly while
+    tweaking other inputs; cache hits skip the whole model pipeline.
+    date_str keys the cache to the slate day so results roll over.
+    """
+    return get_pe().analyze_single_prop(
+        player=player,
+        stat=stat,
+        line=line,
+        odds=odds,
+        settings=dict(get_settings()),
+        debug_mode=False,
+    )
+
+
+def _cache_stats():
+    """Session-scoped hit/miss counters for _analyze_cached."""
+    return st.session_state.setdefault(
+        "analyze_cache_stats", {"hits": 0, "misses": 0, "miss_ms": 0.0}
+    )
+
+
+def _record_timing(stats, ms):
+    """Classify one _analyze_cached call by elapsed wall time.
+
+    A st.cache_data hit returns in well under 5 ms; anything slower ran
+    the model. Heuristic, but good enough to tell "slow because cold"
+    from "slow because the model is slow" when debugging.
+    """
+    if ms < 5.0:
+        stats["hits"] += 1
+    else:
+        stats["misses"] += 1
+        stats["miss_ms"] += ms
+
+# ===============================
+# ⚙️ PAGE CONFIG
+# ===============================
+st.set_page_config(
+    page_title="PropPulse+ | NBA Props",
+    page_icon="🏀",
+    layout="wide",
+    initial_sidebar_state="expanded",
+)
+
+# ===============================
+# 🎨 BRANDING — COLORS + CSS
+# ===============================
+# Built once at import so reruns just re-emit the same string object
+# instead of reallocating the multi-KB block each time.
+_CSS = """
+<style>
+:root {
+    --pp-blue: #007bff;
+    --pp-red:  #ff2d55;
+    --pp-dark: #0c0c0f;
+    --pp-card: #16171a;
+    --pp-border: #2a2b2f;
+    --pp-text: #e6e6e6;
+}
+
+html, body, [class*="css"]  {
+    color: var(--pp-text) !important;
+    background-color: var(--pp-dark) !important;
+}
+
+/* Cards */
+.pp-card {
+    background-color: var(--pp-card);
+    padding: 18px;
+    border-radius: 14px;
+    border: 1px solid var(--pp-border);
+}
+
+/* KPI grid (live viewer summary) */
+.pp-metric-grid {
+    display: grid;
+    grid-template-columns: repeat(5, 1fr);
+    gap: 12px;
+    margin: 8px 0 16px 0;
+}
+.pp-metric {
+    background-color: var(--pp-card);
+    border: 1px solid var(--pp-border);
+    border-radius: 14px;
+    padding: 14px 16px;
+}
+.pp-metric .label {
+    font-size: 0.8rem;
+    color: #9a9aa0;
+}
+.pp-metric .value {
+    font-size: 1.4rem;
+    font-weight: 700;
+}
+
+/* Buttons */
+.stButton button {
+    background: linear-gradient(90deg, var(--pp-blue), var(--pp-red)) !important;
+    border: 0px;
+    color: white !important;
+    padding: 0.7rem 1.2rem;
+    border-radius: 10px;
+    font-weight: 600;
+}
+
+/* Inputs */
+.stTextInput input,
+.stNumberInput input,
+.stSelectbox select {
+    background: var(--pp-card);
+    border: 2px solid var(--pp-border);
+    border-radius: 10px;
+    color: var(--pp-text);
+}
+
+/* Footer */
+#footer-note {
+    text-align: center;
+    font-size: 14px;
+    margin-top: 40px;
+    padding: 12px 0px;
+    color: #888;
+}
+
+/* Mobile — small-screen fixes */
+@media (max-width: 768px) {
+    .stTextInput, .stNumberInput, .stSelectbox, .stButton {
+        width: 100% !important;
+    }
+
+    .block-container {
+        padding-left: 1rem !important;
+        padding-right: 1rem !important;
+    }
+
+    /* Force columns to stack vertically */
+    [data-testid="column"] {
+        display: block !important;
+        width: 100% !important;
+    }
+
+    /* Stack the KPI grid too */
+    .pp-metric-grid {
+        grid-template-columns: repeat(2, 1fr);
+    }
+
+    /* Fix dropdown cutoff issue */
+    .stSelectbox > div {
+        overflow: visible !important;
+    }
+}
+</style>
+"""
+
+# Minified once at import — comments stripped, whitespace collapsed,
+# punctuation tightened. Keeps the block above readable while shipping
+# ~40% fewer bytes to the frontend on every rerun.
+_CSS = re.sub(r"/\*.*?\*/", "", _CSS, flags=re.S)
+_CSS = re.sub(r"\s+", " ", _CSS)
+_CSS = re.sub(r"\s*([{}:;,])\s*", r"\1", _CSS)
+
+
+def _inject_css():
+    """Emit the static CSS block (built once at import, above).
+
+    Deliberately not cached: Streamlit rebuilds the DOM every rerun, so
+    the <style> element must be re-emitted — the saving is in never
+    re-allocating or re-formatting the string itself.
+    """
+    st.markdown(_CSS, unsafe_allow_html=True)
+
+
+_inject_css()
+
+# ===============================
+# 🏀 LOGO (if present)
+# ===============================
+_LOGO_PATH = "proppulse_logo.png"
+
+
+@st.cache_data(show_spinner=False)
+def get_logo_base64(path=_LOGO_PATH, mtime=0.0):
+    """Read + encode the logo once; mtime keys the cache so a swapped
+    file busts it without a server restart."""
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            return base64.b64encode(f.read()).decode()
+    return None
+
+# One markdown call for the header — logo and title together instead of
+# a separate element (and DOM delta) each.
+logo_b64 = get_logo_base64(
+    _LOGO_PATH,
+    os.path.getmtime(_LOGO_PATH) if os.path.exists(_LOGO_PATH) else 0.0,
+)
+_HEADER_TPL = "{logo}<h2><b>PropPulse+ NBA Prop Analyzer</b></h2>"
+_logo_html = (
+    f'<img src="data:image/png;base64,{logo_b64}" width="140"><br>'
+    if logo_b64 else ""
+)
+st.markdown(_HEADER_TPL.format(logo=_logo_html), unsafe_allow_html=True)
+# ===============================
+# 📌 SIDEBAR — User Controls
+# ===============================
+with st.sidebar:
+    st.markdown("### ⚙️ PropPulse+ Controls")
+    st.markdown("---")
+
+    mode = st.radio(
+        "Select Mode",
+        ["Single Prop Analyzer", "Batch Analyzer", "Live EV Sheet Viewer"],
+        index=0
+    )
+
+    st.markdown("---")
+    st.markdown("📅 **Date:** Today’s slate auto-detected")
+    st.markdown("---")
+
+    st.markdown("""
+    <div style='text-align:center;color:#888;font-size:13px;margin-top:40px;'>
+        PropPulse+ v2025.6<br>
+        Blue-Red Theme · Mobile Optimized
+    </div>
+    """, unsafe_allow_html=True)
+
+# ===============================
+# 🧩 MAIN LAYOUT
+# ===============================
+
+# Helper: Clean line formatting
+def clean_float(value):
+    try:
+        return float(value)
+    except:
+        return None
+
+
+def _cell_str(value):
+    """Editor cell as a stripped string, with None/NaN treated as empty.
+
+    Rows added via the data editor's "+" button come back with None/NaN
+    in unfilled cells, and str() would turn those into the truthy
+    "None"/"nan".
+    """
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return ""
+    return str(value).strip()
+
+
+def alt_line_mask(df):
+    """Boolean mask keeping standard .5 lines, dropping alt whole-number lines.
+
+    Vectorized: one pass over the Line column instead of a per-row apply.
+    Non-numeric rows are kept untouched. Returned as a numpy array so it
+    can be AND-ed with other filter masks before a single slice.
+    """
+    if "Line" not in df.columns:
+        return np.ones(len(df), dtype=bool)
+    vals = pd.to_numeric(df["Line"], errors="coerce").to_numpy(dtype=float)
+    frac = np.abs(vals - np.round(vals))
+    keep = np.abs(frac - 0.5) < 1e-9
+    keep |= np.isnan(vals)
+    return keep
+
+
+def summarize_results(result_col):
+    """Tally ✓ / ✗ / ⏳ from a Result column (Series).
+
+    One value_counts() pass instead of a separate equality scan per symbol.
+    Takes just the column so callers never hand over (or hash) the whole
+    frame for what is a single-column computation.
+    """
+    vc = result_col.astype(str).str.strip().value_counts()
+    wins = int(vc.get("✓", 0))
+    losses = int(vc.get("✗", 0))
+    pending = int(vc.get("⏳", 0))
+    total = wins + losses
+    win_pct = (wins / total * 100) if total > 0 else 0.0
+    return {"wins": wins, "losses": losses, "pending": pending, "win_pct": win_pct}
+
+
+# Derived views of the cached sheet. The sheet itself is served by
+# reference (cache_resource), so its identity is stable across reruns —
+# keying on id() skips re-hashing the whole frame on every widget tick.
+@st.cache_data(ttl=60, show_spinner=False, hash_funcs={pd.DataFrame: id})
+def _summarize_cached(df):
+    if "Result" not in df.columns:
+        return None
+    return summarize_results(df["Result"])
+
+
+@st.cache_data(ttl=60, show_spinner=False, hash_funcs={pd.DataFrame: id})
+def _alt_mask_cached(df):
+    """alt_line_mask once per sheet fetch — toggling other filters reuses it."""
+    return alt_line_mask(df)
+
+
+# Sheet EV cells can carry '+'/'¢' decoration ("+12¢") that plain
+# to_numeric would coerce to NaN. One translate pass strips both —
+# a replace-per-character chain would allocate a Series per pass.
+_EV_TRANS = str.maketrans("", "", "+¢")
+
+
+def _ev_numeric(s):
+    """Parse an EV column to float, tolerating '+12¢'-style cells."""
+    if pd.api.types.is_numeric_dtype(s):
+        return s
+    return pd.to_numeric(s.astype(str).str.translate(_EV_TRANS), errors="coerce")
+
+
+@st.cache_data(ttl=60, show_spinner=False, hash_funcs={pd.DataFrame: id})
+def _positive_ev_count(df):
+    """Count +EV rows with one reduction — no intermediate filtered frame."""
+    if "EV" not in df.columns:
+        return 0
+    return int(_ev_numeric(df["EV"]).gt(0).sum())
+
+
+@st.cache_data(ttl=60, show_spinner=False, hash_funcs={pd.DataFrame: id})
+def _column_options(df):
+    """Dropdown options for the quick filter — computed once per sheet fetch."""
+    return df.columns.tolist()
+
+
+@st.cache_data(ttl=60, show_spinner=False, hash_funcs={pd.DataFrame: id})
+def _stringified(df, col):
+    """String view of one column for substring filtering.
+
+    Text columns are already string dtype from ingest; everything else
+    (EV, Line, …) is cast here once per (sheet fetch, column) instead of
+    on every filter apply.
+    """
+    s = df[col]
+    if not isinstance(s.dtype, pd.StringDtype):
+        s = s.astype(str)
+    return s
+
+
+# Explicit dtypes for result tables: skips pandas object-dtype
+# inference, Arrow-encodes compactly (float32 halves the float payload
+# to the frontend), and categoricals dict-encode the small vocabularies.
+_RESULT_SCHEMA = {
+    "player": "string",
+    "stat": "category",
+    "line": "float32",
+    "odds": "int16",
+    "projection": "float32",
+    "p_model": "float32",
+    "p_book": "float32",
+    "ev": "float32",
+    "n_games": "int16",
+    "confidence": "float32",
+    "grade": "category",
+    "grade_simple": "category",
+    "opponent": "category",
+    "position": "category",
+    "dvp_mult": "float32",
+    "EV¢": "float32",
+}
+
+
+def _as_result_frame(results):
+    """Build a typed DataFrame from analysis result dicts."""
+    df = pd.DataFrame(results)
+    return df.astype({k: v for k, v in _RESULT_SCHEMA.items() if k in df.columns})
+
+
+def run_batch(entries):
+    """Analyze a list of {Player, Stat, Line, Odds} dicts in parallel.
+
+    Each prop analysis is dominated by network I/O (stats APIs, schedule
+    lookups), so overlapping them in a small thread pool makes batch
+    latency ~max(prop) instead of sum(props). Returns (results, errors)
+    where errors is a list of (entry, message) pairs.
+    """
+    # A header-only CSV reaches here with zero entries; min(8, 0) would
+    # hand ThreadPoolExecutor an invalid max_workers of 0.
+    if not entries:
+        return [], []
+
+    # Exact duplicates run once. _analyze_cached can't help here: dupes
+    # dispatched together hit the pool concurrently, before the first
+    # one has populated the cache.
+    unique = {}
+    for e in entries:
+        unique.setdefault((e["Player"], e["Stat"], e["Line"], e["Odds"]), e)
+    entries = list(unique.values())
+
+    results, errors = [], []
+    stats = _cache_stats()
+
+    def _run_entry(entry):
+        t0 = time.perf_counter()
+        try:
+            res = _analyze_cached(
+                entry["Player"],
+                entry["Stat"],
+                clean_float(entry["Line"]),
+                entry["Odds"],
+                _TODAY_STR,
+            )
+            return entry, res, None, (time.perf_counter() - t0) * 1000.0
+        except Exception as e:
+            return entry, None, str(e), (time.perf_counter() - t0) * 1000.0
+
+    workers = min(8, len(entries))
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        # Timings come back with each entry and are recorded here on the
+        # main thread — session_state isn't safe to touch from workers.
+        for entry, res, err, ms in ex.map(_run_entry, entries):
+            _record_timing(stats, ms)
+            if err:
+                errors.append((entry, err))
+            elif res:
+                results.append(res)
+    return results, errors
+
+
+def _fragment(fn):
+    """Scope reruns to one mode's body when Streamlit supports fragments.
+
+    st.fragment (1.33+, or its experimental predecessor) reruns just the
+    decorated function for interactions inside it, skipping the rest of
+    the script; on older Streamlit the function simply runs as part of
+    the full-script rerun.
+    """
+    frag = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+    return frag(fn) if frag else fn
+
+
+def report_batch_errors(errors):
+    """Emit all failed batch rows as one element.
+
+    One st.error per bad row means one frontend message per row — a
+    messy 150-prop sheet turns into dozens of element deltas. One
+    aggregated warning is one message regardless of count.
+    """
+    if not errors:
+        return
+    lines = "\n\n".join(f"• {entry['Player']}: {err}" for entry, err in errors)
+    st.warning(f"⚠️ {len(errors)} prop(s) failed:\n\n{lines}")
+
+
+@st.cache_data(show_spinner=False)
+def _read_uploaded_csv(name, size, data):
+    """Parse an uploaded CSV once per file.
+
+    st.file_uploader keeps the upload across reruns, so without caching
+    every widget tick would re-parse it. Keyed on (name, size, bytes) —
+    same file, same frame.
+    """
+    buf = io.BytesIO(data)
+    try:
+        # Same as the sheet loader: Arrow's parser is multithreaded and
+        # skips the slower Python-level dtype inference when available.
+        return pd.read_csv(buf, engine="pyarrow")
+    except (ImportError, ValueError):
+        buf.seek(0)
+        return pd.read_csv(buf)
+
+
+def color_ev_col(s):
+    """Column-wise EV cell colors — one vectorized pass, not one call per cell."""
+    v = _ev_numeric(s).to_numpy(dtype=float)
+    return np.where(
+        v > 0, "background-color: rgba(52,199,89,0.12); color:#caf7d2;",
+        np.where(v < 0, "background-color: rgba(229,83,83,0.10); color:#ffd6d6;", ""),
+    )
+
+
+def row_ev_styles(df):
+    """Whole-frame row tint by EV sign, for Styler.apply(axis=None).
+
+    One numpy pass over EV broadcast across the row — no per-row Python
+    callback, which is where axis=1 stylers burn time on big slates.
+    """
+    if "EV" not in df.columns:
+        return pd.DataFrame("", index=df.index, columns=df.columns)
+    ev = _ev_numeric(df["EV"]).to_numpy(dtype=float)
+    row = np.where(
+        ev > 0, "background-color: rgba(52,199,89,0.04);",
+        np.where(ev < 0, "background-color: rgba(229,83,83,0.03);", ""),
+    )
+    return pd.DataFrame(
+        np.broadcast_to(row[:, None], df.shape), index=df.index, columns=df.columns
+    )
+
+
+def _load_live_sheet_impl():
+    """Fetch and clean the live EV board. Uncached — see load_live_sheet."""
+    try:
+        # Fetch the bytes ourselves (bounded timeout, clean HTTP errors)
+        # and hand pandas an in-memory buffer instead of a URL.
+        resp = _HTTP.get(SHEET_CSV_URL, timeout=10)
+        resp.raise_for_status()
+        buf = io.BytesIO(resp.content)
+        try:
+            # Arrow parser is multithreaded and skips the slower
+            # Python-level dtype inference when available.
+            df = pd.read_csv(buf, engine="pyarrow")
+        except (ImportError, ValueError):
+            buf.seek(0)
+            df = pd.read_csv(buf)
+        # Single rename with only the headers that actually change —
+        # skips the index rebuild entirely when the sheet is clean.
+        mapping = {
+            c: cleaned
+            for c in df.columns
+            if (cleaned := _WS_RE.sub(" ", str(c)).strip()) != c
+        }
+        if mapping:
+            df.rename(columns=mapping, inplace=True)
+        # Normalize the text columns to string dtype once at ingest so
+        # per-rerun filters don't redo astype(str) over the whole slate.
+        for c in ("Player", "Stat", "Opponent", "Result"):
+            if c in df.columns:
+                df[c] = df[c].astype("string").fillna("")
+        # Parse EV to numeric once at ingest — the stylers and the +EV
+        # counter then take their numeric fast path on every rerun
+        # instead of re-stripping '+¢' decoration per style pass.
+        if "EV" in df.columns:
+            df["EV"] = _ev_numeric(df["EV"])
+        return df
+    except Exception as e:
+        st.error(f"❌ Error loading Google Sheet: {e}")
+        return None
+
+
+# cache_resource returns the frame by reference (no pickle/hash round
+# trip on every hit) — viewers only read it, so sharing is safe. The
+# cache is global across sessions, so a 60s TTL keeps the board fresh
+# for everyone while the Refresh button stays a manual override.
+load_live_sheet = st.cache_resource(ttl=60, show_spinner=False)(_load_live_sheet_impl)
+
+# ===============================
+# 🎯 PROJECTION SNAPSHOT — UI Block
+# ===============================
+
+# Templates built once at import; the render paths only fill the slots.
+_SNAPSHOT_GRID_TPL = (
+    '<div class="pp-metric-grid" style="grid-template-columns:repeat(3,1fr);">'
+    '<div class="pp-metric"><div class="label">Projection</div><div class="value">{proj}</div></div>'
+    '<div class="pp-metric"><div class="label">Line</div><div class="value">{line}</div></div>'
+    '<div class="pp-metric"><div class="label">EV (¢)</div><div class="value">{ev}</div></div>'
+    "</div>"
+)
+
+_SUMMARY_GRID_TPL = (
+    '<div class="pp-metric-grid">'
+    '<div class="pp-metric"><div class="label">Hits (✓)</div><div class="value">{wins}</div></div>'
+    '<div class="pp-metric"><div class="label">Misses (✗)</div><div class="value">{losses}</div></div>'
+    '<div class="pp-metric"><div class="label">Pending (⏳)</div><div class="value">{pending}</div></div>'
+    '<div class="pp-metric"><div class="label">Win %</div><div class="value">{win_pct:.1f}%</div></div>'
+    '<div class="pp-metric"><div class="label">+EV props</div><div class="value">{pos_ev}</div></div>'
+    "</div>"
+)
+
+_PP_CARD_TPL = (
+    '<div class="pp-card">'
+    "<b>Opponent:</b> {opp}<br>"
+    "<b>DvP Multiplier:</b> {dvp}<br>"
+    "<b>Confidence Score:</b> {conf}"
+    "</div>"
+)
+
+
+def render_projection_snapshot(result):
+    """Pretty, mobile-friendly projection visual"""
+    if result is None:
+        return
+
+    proj = result.get("projection")
+    line = result.get("line")
+    ev  = result.get("EV¢")
+    conf = result.get("confidence")
+    opp = result.get("opponent")
+    dvp = result.get("dvp_mult")
+
+    # Heading, metric grid and context card concatenated into one
+    # markdown call — one frontend delta and one DOM insertion for the
+    # whole snapshot instead of three.
+    grid = _SNAPSHOT_GRID_TPL.format(
+        proj=f"{proj:.2f}" if proj is not None else "—",
+        line=line if line is not None else "—",
+        ev=ev if ev is not None else "—",
+    )
+    card = _PP_CARD_TPL.format(opp=opp or "—", dvp=dvp or "—", conf=conf or "—")
+    st.markdown(f"### 📈 Model Snapshot\n\n{grid}{card}", unsafe_allow_html=True)
+# ==========================================================
+# 🔍 SINGLE PROP ANALYZER
+# ==========================================================
+@_fragment
+def single_prop_mode():
+    st.markdown("## 🔍 Single Prop Analyzer")
+
+    # Input form layout
+    with st.form("single_form"):
+        col1, col2, col3, col4 = st.columns(4)
+
+        player_name = col1.text_input("Player Name")
+        stat = col2.selectbox("Stat", _STAT_OPTIONS)
+        line = col3.text_input("Line (e.g., 7.5)")
+        odds = col4.text_input("Odds (e.g., -110)", "-110")
+
+        debug = st.checkbox("Enable Debug Mode", value=False)
+
+        submitted = st.form_submit_button("🚀 RUN ANALYSIS")
+
+    if submitted:
+        if not player_name or not line:
+            st.error("⚠️ Please provide both a player name and a line.")
+            st.stop()
+
+        settings = dict(get_settings())  # shallow copy so callers can't mutate the shared dict
+        line_val = clean_float(line)
+
+        with st.spinner("🧠 Running full PropPulse+ model…"):
+            try:
+                # Only pay for stdout capture when the user asked for it —
+                # the model prints a lot, and buffering it on every run
+                # is wasted work when nothing is ever shown.
+                if debug:
+                    buf = io.StringIO()
+                    with redirect_stdout(buf):
+                        result = get_pe().analyze_single_prop(
+                            player=player_name,
+                            stat=stat,
+                            line=line_val,
+                            odds=odds,
+                            settings=settings,
+                            debug_mode=True,
+                        )
+                    debug_text = buf.getvalue()
+                else:
+                    t0 = time.perf_counter()
+                    result = _analyze_cached(
+                        player_name, stat, line_val, odds, _TODAY_STR
+                    )
+                    _record_timing(_cache_stats(), (time.perf_counter() - t0) * 1000.0)
+                    debug_text = ""
+            except Exception as e:
+                st.error(f"❌ Error while analyzing: {e}")
+                st.stop()
+
+        # Persist so the result survives reruns that aren't submits —
+        # toggling anything else no longer blanks (or re-runs) the
+        # analysis.
+        st.session_state["last_result"] = result
+        st.session_state["last_debug"] = debug_text
+
+    if "last_result" in st.session_state:
+        result = st.session_state["last_result"]
+        debug_text = st.session_state["last_debug"]
+
+        if debug and debug_text:
+            with st.expander("🛠 Model Debug Output"):
+                st.code(debug_text)
+
+        if debug:
+            stats = _cache_stats()
+            total = stats["hits"] + stats["misses"]
+            if total:
+                avg_miss = stats["miss_ms"] / max(stats["misses"], 1)
+                st.caption(
+                    f"Analysis cache: {stats['hits']}/{total} hits this session · "
+                    f"avg miss {avg_miss:.0f} ms"
+                )
+
+        if result:
+            render_projection_snapshot(result)
+            st.markdown("### 📤 Full Output")
+            st.json(result)
+        else:
+            st.warning("⚠️ No data returned for this player.")
+# ==========================================================
+# 📦 BATCH ANALYZER
+# ==========================================================
+@_fragment
+def batch_mode():
+    st.markdown("## 📦 Batch Analyzer")
+
+    st.info("Upload a CSV or enter multiple props and analyze them all at once.")
+
+    # --- CSV upload path ---
+    st.markdown("### 📤 Upload CSV")
+    uploaded = st.file_uploader(
+        "CSV with Player, Stat, Line, Odds columns", type=["csv"]
+    )
+
+    df_upload = None
+    if uploaded is not None:
+        # The type=["csv"] filter only checks the extension — a malformed
+        # file still reaches the parser, and ParserError is a ValueError
+        # the pyarrow fallback inside doesn't absorb.
+        try:
+            df_upload = _read_uploaded_csv(
+                uploaded.name, uploaded.size, uploaded.getvalue()
+            )
+        except Exception as e:
+            st.error(f"❌ Could not parse {uploaded.name}: {e}")
+
+    if df_upload is not None:
+        st.dataframe(df_upload.head(20), use_container_width=True)
+
+        if st.button("🚀 ANALYZE CSV"):
+            col_map = {c.strip().lower(): c for c in df_upload.columns}
+            missing = [k for k in ("player", "stat", "line", "odds") if k not in col_map]
+            if missing:
+                st.error(f"❌ CSV is missing columns: {', '.join(missing)}")
+            else:
+                # to_dict('records') hands the dispatch plain dicts — no
+                # per-row Series boxing the way iterrows would.
+                sub = df_upload[[col_map[k] for k in ("player", "stat", "line", "odds")]]
+                sub.columns = ["Player", "Stat", "Line", "Odds"]
+                with st.spinner("🧠 Running CSV batch…"):
+                    results, errors = run_batch(sub.to_dict("records"))
+                report_batch_errors(errors)
+                st.session_state["csv_results"] = _as_result_frame(results)
+
+    # Results live in session_state so touching any other widget after
+    # the analyze click doesn't wipe them on the rerun.
+    csv_results = st.session_state.get("csv_results")
+    if csv_results is not None:
+        st.markdown("### 📊 CSV Results")
+        if csv_results.empty:
+            st.warning("⚠️ No results produced from the CSV.")
+        else:
+            st.dataframe(csv_results, use_container_width=True)
+
+    st.markdown("---")
+
+    st.markdown("### ✏️ Enter Props")
+
+    # Paste mode trades the grid for a single text_area — handy for big
+    # slates copied straight out of a spreadsheet (tab-separated).
+    entry_style = st.radio(
+        "Entry style", ["Grid editor", "Paste from spreadsheet"], horizontal=True
+    )
+
+    with st.form("batch_form"):
+        if entry_style == "Grid editor":
+            # One data_editor component instead of 4 widgets per row — at 20
+            # props that's 1 frontend round-trip in place of 80 re-created
+            # widgets on every rerun.
+            template = pd.DataFrame({
+                "Player": [""] * 5,
+                "Stat": ["PTS"] * 5,
+                "Line": [""] * 5,
+                "Odds": ["-110"] * 5,
+            })
+            edited = st.data_editor(
+                template,
+                key="batch_editor",
+                num_rows="dynamic",
+                use_container_width=True,
+                column_config={
+                    "Stat": st.column_config.SelectboxColumn(
+                        "Stat",
+                        options=_STAT_OPTIONS,
+                        required=True,
+                    ),
+                },
+            )
+        else:
+            pasted = st.text_area(
+                "One prop per line: Player ⇥ Stat ⇥ Line ⇥ Odds (tab-separated)",
+                key="batch_paste",
+                height=160,
+            )
+
+        submitted = st.form_submit_button("🚀 ANALYZE BATCH")
+
+    if entry_style == "Grid editor":
+        manual_entries = [
+            r for r in edited.to_dict("records")
+            if _cell_str(r["Player"]) and _cell_str(r["Line"])
+        ]
+    else:
+        manual_entries = []
+        if pasted.strip():
+            try:
+                df_paste = pd.read_csv(
+                    io.StringIO(pasted),
+                    sep="\t",
+                    names=["Player", "Stat", "Line", "Odds"],
+                    dtype=str,
+                ).fillna("")
+                for r in df_paste.to_dict("records"):
+                    if str(r["Player"]).strip() and str(r["Line"]).strip():
+                        r["Odds"] = str(r["Odds"]).strip() or "-110"
+                        manual_entries.append(r)
+            except Exception as e:
+                st.error(f"❌ Could not parse pasted props: {e}")
+
+    if manual_entries:
+        if submitted:
+            st.markdown("### 📊 Batch Results")
+
+            with st.spinner("🧠 Running batch analysis…"):
+                results, errors = run_batch(manual_entries)
+
+            report_batch_errors(errors)
+
+            if results:
+                df_results = _as_result_frame(results)
+                st.dataframe(df_results, use_container_width=True)
+
+                # One pass for all three headline picks instead of
+                # three separate max() scans over the results.
+                best_ev = best_conf = best_edge = results[0]
+                be = bc = bd = float("-inf")
+                for r in results:
+                    e = r.get("ev", float("-inf"))
+                    c = r.get("confidence", float("-inf"))
+                    d = r.get("p_model", 0.0) - r.get("p_book", 0.0)
+                    if e > be:
+                        be, best_ev = e, r
+                    if c > bc:
+                        bc, best_conf = c, r
+                    if d > bd:
+                        bd, best_edge = d, r
+                st.markdown(
+                    f"**🏆 Best EV:** {best_ev['player']} ({best_ev.get('EV¢', '—')}¢) · "
+                    f"**🔒 Highest confidence:** {best_conf['player']} ({bc:.0%}) · "
+                    f"**📐 Biggest edge:** {best_edge['player']} ({bd:+.1%})"
+                )
+            else:
+                st.warning("⚠️ No results produced.")
+    else:
+        st.info("✏️ Add props above, then click ANALYZE BATCH.")
+# ==========================================================
+# 📡 LIVE EV SHEET VIEWER
+# ==========================================================
+@_fragment
+def live_sheet_mode():
+    st.markdown("## 📡 Live EV Sheet Viewer")
+
+    st.info("This pulls directly from your Google Sheets EV board.")
+
+    if st.button("🔄 Refresh now"):
+        load_live_sheet.clear()
+
+    with st.spinner("🔄 Loading live EV board…"):
+        df_sheet = load_live_sheet()
+
+    if df_sheet is not None:
+        st.success("✅ Live sheet loaded")
+
+        summary = _summarize_cached(df_sheet)
+        if summary:
+            # One markdown call for the whole KPI row — a columns+metric
+            # layout would send four separate DOM deltas per rerun.
+            st.markdown(
+                _SUMMARY_GRID_TPL.format(**summary, pos_ev=_positive_ev_count(df_sheet)),
+                unsafe_allow_html=True,
+            )
+
+        hide_alts = st.checkbox("Hide alt lines (.5 lines only)", value=False)
+
+        # Optional: simple filters for mobile usability.
+        # Wrapped in a form so the script reruns once on Apply instead of
+        # on every keystroke in the search box.
+        st.markdown("### 🔍 Quick Filter")
+        with st.form("quick_filter_form"):
+            col_to_filter = st.selectbox("Column", _column_options(df_sheet))
+            filter_val = st.text_input("Search")
+            st.form_submit_button("Apply")
+
+        # AND every active filter into one boolean mask and slice once,
+        # instead of reallocating the frame per filter step.
+        mask = np.ones(len(df_sheet), dtype=bool)
+        if hide_alts:
+            mask &= _alt_mask_cached(df_sheet)
+        if filter_val:
+            # regex=False: the search box is a literal, so skip the
+            # regex engine entirely.
+            mask &= (
+                _stringified(df_sheet, col_to_filter)
+                .str.contains(filter_val, case=False, regex=False, na=False)
+                .to_numpy(dtype=bool)
+            )
+        df_view = df_sheet if mask.all() else df_sheet.loc[mask]
+
+        if "EV" in df_view.columns:
+            st.dataframe(
+                df_view.style.apply(row_ev_styles, axis=None)
+                .apply(color_ev_col, subset=["EV"]),
+                use_container_width=True,
+            )
+        else:
+            st.dataframe(df_view, use_container_width=True)
+
+
+# Dispatch on the sidebar radio — the radio itself stays outside the
+# fragments, so switching modes still triggers a normal full rerun.
+if mode == "Single Prop Analyzer":
+    single_prop_mode()
+elif mode == "Batch Analyzer":
+    batch_mode()
+else:
+    live_sheet_mode()
+# ==========================================================
+# 🛠️ UTILITY FUNCTIONS
+# ==========================================================
+
+@st.cache_data(max_entries=32, show_spinner=False, hash_funcs={pd.DataFrame: id})
+def convert_df_to_csv(df: pd.DataFrame):
+    """Convert a dataframe to CSV bytes for download.
+
+    Cached by frame identity so reruns while the download button sits
+    on screen don't re-serialize (and re-allocate) the whole CSV.
+    """
+    return df.to_csv(index=False).encode("utf-8")
+
+
+def render_download_button(df, label="📥 Download CSV", file_name="proppulse_export.csv"):
+    """Generic CSV download button"""
+    if df is None or df.empty:
+        return
+
+    csv_bytes = convert_df_to_csv(df)
+
+    st.download_button(
+        label=label,
+        data=csv_bytes,
+        file_name=file_name,
+        mime="text/csv",
+        use_container_width=True
+    )
+
+
+# ==========================================================
+# 📉 CUSTOM PROJECTION VISUAL — GAIN/LOSS BAR
+# ==========================================================
+
+# Layout is identical on every render — build the dict once and splat it
+# into update_layout instead of reallocating it per figure.
+_BAR_LAYOUT = dict(
+    height=200,
+    margin=dict(l=0, r=0, t=20, b=0),
+    template="plotly_dark",
+)
+
+
+@st.cache_data(show_spinner=False)
+def _projection_bar_fig(projection, line):
+    """Build the projection-vs-line figure, memoized on its only inputs.
+
+    The figure is a pure function of (projection, line); caching it means
+    re-submitting the same prop (or any rerun that re-renders the result)
+    skips the whole plotly construction and serializes a stored figure.
+    """
+    import plotly.graph_objects as go
+
+    diff = projection - line
+
+    color = "#007bff" if diff >= 0 else "#ff2d55"
+    label = "Projected ↑" if diff >= 0 else "Projected ↓"
+
+    fig = go.Figure()
+
+    fig.add_trace(
+        go.Indicator(
+            mode="number+delta",
+            value=projection,
+            delta={"reference": line, "relative": False},
+            number={"font": {"size": 38}},
+            title={"text": f"<b>{label}</b><br><span style='font-size:16px'>Line = {line}</span>"}
+        )
+    )
+
+    fig.update_layout(**_BAR_LAYOUT)
+
+    return fig
+
+
+def render_projection_bar(projection, line):
+    """Draws a simple horizontal line showing projection vs line"""
+
+    if projection is None or line is None:
+        st.info("No projection available.")
+        return
+
+    st.plotly_chart(_projection_bar_fig(projection, line), use_container_width=True)
+# ==========================================================
+# 🧾 FOOTER — PROPULSE BRANDING
+# ==========================================================
+
+st.markdown("""
+<div id="footer-note">
+    Built with ❤️ by <b>QacePicks</b><br>
+    Powered by PropPulse+ · Data-Driven NBA Betting Tools
+</div>
+""", unsafe_allow_html=True)
+# ==========================================================
+# 🧩 END OF MAIN APP LOGIC
+# ==========================================================
+
+def safe_run():
+    """Wrapper to prevent Streamlit from crashing silently."""
+    try:
+        pass  # All logic is executed above directly in the layout
+    except Exception as e:
+        st.error(f"Unexpected error in app: {e}")
+
+
+if __name__ == "__main__":
+    safe_run()
@@ -496,7 +496,15 @@ def calibrated_prob_over(mu_base: float,
     p_blend = (1 - w_emp) * p_model + w_emp * p_emp
     return finalize_prob(p_blend)
 
-def american_to_prob(odds: int) -> float:
+def american_to_prob(odds):
+    """
+    American odds → implied probability.
+    Accepts a scalar (int) or a NumPy array / Series — array input is
+    converted in one vectorized pass instead of a Python branch per row.
+    """
+    if isinstance(odds, (np.ndarray, pd.Series)):
+        o = np.asarray(odds, dtype=float)
+        return np.where(o < 0, -o / (-o + 100.0), 100.0 / (o + 100.0))
     return abs(odds) / (abs(odds) + 100) if odds < 0 else 100 / (odds + 100)
 
 def net_payout(odds: int) -> float:
@@ -1101,30 +1109,21 @@ def analyze_batch_df(df_input: pd.DataFrame, settings=None, debug_mode=False) ->
     if settings is None:
         settings = load_settings()
 
-    col_map = {c.lower(): c for c in df_input.columns}
-
-    def get_col(name_options):
-        for name in name_options:
-            if name.lower() in col_map:
-                return col_map[name.lower()]
-        return None
+    df_norm = df_input.rename(columns={c: c.lower() for c in df_input.columns})
 
-    col_player = get_col(["Player", "player"])
-    col_stat   = get_col(["Stat", "stat"])
-    col_line   = get_col(["Line", "line"])
-    col_odds   = get_col(["Odds", "odds"])
-
-    if not all([col_player, col_stat, col_line, col_odds]):
+    if any(k not in df_norm.columns for k in ("player", "stat", "line", "odds")):
         print("[BatchDF] ❌ Missing required columns in input DataFrame.")
         return pd.DataFrame()
 
     results = []
-    for idx, row in df_input.iterrows():
+    # to_dict('records') gives plain dicts up front; iterrows() would build
+    # a fresh Series per row just to read four fields from it.
+    for idx, row in enumerate(df_norm.to_dict("records")):
         try:
-            player = str(row[col_player]).strip()
-            stat = str(row[col_stat]).strip()
-            line = row[col_line]
-            odds = row[col_odds]
+            player = str(row.get("player", "")).strip()
+            stat = str(row.get("stat", "")).strip()
+            line = row.get("line")
+            odds = row.get("odds")
             if not player or not stat:
                 continue
             res = analyze_single_prop(player, stat, line, odds, settings, debug_mode=debug_mode)
@@ -1135,6 +1134,68 @@ def analyze_batch_df(df_input: pd.DataFrame, settings=None, debug_mode=False) ->
 
     return pd.DataFrame(results) if results else pd.DataFrame()
 
+def quick_confidence(player, stat, settings=None) -> float:
+    """
+    Cheap upper bound on a prop's confidence score, from sample size only.
+    Confidence in analyze_single_prop is base_conf * maturity with
+    maturity = min(1, n_games / 40) and base_conf <= 1, so the locally
+    cached game-log row count bounds it from above — no network, no
+    projection math. Returns 1.0 when no local log exists, so unknown
+    players are never skipped on a guess.
+    """
+    settings = settings or {}
+    data_path = settings.get("data_path", DATA_PATH_DEFAULT)
+    path = os.path.join(data_path, f"{player.replace(' ', '_')}.csv")
+    if not os.path.exists(path):
+        return 1.0
+    try:
+        with open(path) as f:
+            n_games = max(0, sum(1 for _ in f) - 1)  # minus header
+    except Exception:
+        return 1.0
+    return max(0.1, min(0.99, n_games / 40.0))
+
+def analyze_props_batch(df_input: pd.DataFrame, settings=None, min_confidence=None) -> pd.DataFrame:
+    """
+    Batch interface that amortizes per-player setup:
+    Expects columns: Player, Stat, Line, Odds (case-insensitive).
+    Rows are grouped by player so each player's props run back-to-back —
+    the first prop fetches and saves the game log, the rest of that
+    player's props hit the warm local copy instead of refetching.
+    When min_confidence is set, rows whose quick_confidence upper bound
+    falls below it skip the full analysis entirely.
+    """
+    if settings is None:
+        settings = load_settings()
+
+    col_map = {c.lower(): c for c in df_input.columns}
+    required = ("player", "stat", "line", "odds")
+    if any(k not in col_map for k in required):
+        print("[BatchDF] ❌ Missing required columns in input DataFrame.")
+        return pd.DataFrame()
+
+    sub = df_input[[col_map[k] for k in required]].copy()
+    sub.columns = list(required)
+
+    results = []
+    for player, group in sub.groupby("player", sort=False):
+        for row in group.itertuples(index=False):
+            try:
+                p = str(row.player).strip()
+                s = str(row.stat).strip()
+                if not p or not s:
+                    continue
+                if min_confidence is not None and quick_confidence(p, s, settings) < min_confidence:
+                    print(f"[Batch] ⏭️ Skipping {p} {s} — confidence bound below {min_confidence}")
+                    continue
+                res = analyze_single_prop(p, s, row.line, row.odds, settings, debug_mode=False)
+                if res:
+                    results.append(res)
+            except Exception as e:
+                print(f"[Batch] ⚠️ Error on {row.player}: {e}")
+
+    return pd.DataFrame(results) if results else pd.DataFrame()
+
 def analyze_batch(df_input, settings=None, debug_mode=False):
     """
     Generic batch alias: